@@ -0,0 +1,83 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Ahead-of-time compiled bitmask backtracker for the N-Queens solver.
+It mirrors _solve_nb in solver.py, but needs neither numba nor a JIT warmup.
+Build it in place with: python setup.py build_ext --inplace
+"""
+
+# Largest board the compiled solver supports, bitmasks are held in unsigned 64-bit integers
+cdef enum:
+    _MAX_N = 64
+MAX_N = _MAX_N
+
+
+def solve_nqueens(int n, long long[::1] out, int start=0):
+    """
+    Writes the row of the queen in every column to out and returns True when a solution exists.
+    The first start entries of out are taken as already placed queens and are kept fixed.
+    The search runs with the GIL released, so other Python threads keep running meanwhile.
+    """
+    cdef bint found
+    if n < 0 or n > _MAX_N:
+        raise ValueError(f"n must be between 0 and {_MAX_N}, got {n}")
+    if out.shape[0] < n:
+        raise ValueError(f"out must hold at least n={n} entries, got {out.shape[0]}")
+    if not 0 <= start <= n:
+        raise ValueError(f"start must be between 0 and n={n}, got {start}")
+    for row in range(start):
+        if not 0 <= out[row] < n:
+            raise ValueError(f"fixed queen in column {row} has row {out[row]}, outside the board")
+    with nogil:
+        found = _solve(n, out, start)
+    return found
+
+
+cdef bint _solve(int n, long long[::1] out, int start) noexcept nogil:
+    """
+    Bitmask backtracking over explicit per-row stacks, arguments are validated by solve_nqueens.
+    """
+    cdef unsigned long long cols[_MAX_N + 1]
+    cdef unsigned long long d1[_MAX_N + 1]
+    cdef unsigned long long d2[_MAX_N + 1]
+    cdef unsigned long long free[_MAX_N + 1]
+    cdef unsigned long long placed[_MAX_N]
+    cdef unsigned long long full, bit
+    cdef int row, index
+
+    if n == 0:
+        return True
+    full = (<unsigned long long>-1) >> (64 - n)
+    cols[0] = d1[0] = d2[0] = 0
+    # Replaying the fixed queens into the masks
+    for row in range(start):
+        bit = (<unsigned long long>1) << out[row]
+        cols[row + 1] = cols[row] | bit
+        d1[row + 1] = (d1[row] | bit) << 1
+        d2[row + 1] = (d2[row] | bit) >> 1
+    free[start] = ~(cols[start] | d1[start] | d2[start]) & full
+    row = start
+    while row >= start:
+        if row == n:
+            # Translating the placed bits into row indexes
+            for row in range(start, n):
+                bit = placed[row]
+                index = 0
+                while bit > 1:
+                    bit >>= 1
+                    index += 1
+                out[row] = index
+            return True
+        if free[row] == 0:
+            # No legal rows left, backtracking to the previous column
+            row -= 1
+            continue
+        # Taking the lowest legal row and removing it from the mask
+        bit = free[row] & (~free[row] + 1)
+        free[row] ^= bit
+        placed[row] = bit
+        cols[row + 1] = cols[row] | bit
+        d1[row + 1] = (d1[row] | bit) << 1
+        d2[row + 1] = (d2[row] | bit) >> 1
+        row += 1
+        free[row] = ~(cols[row] | d1[row] | d2[row]) & full
+    return False
@@ -0,0 +1,15 @@
+"""
+Builds the optional Cython solver used by solver.py: python setup.py build_ext --inplace
+"""
+import sys
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+# MSVC does not understand the GCC/Clang optimization flags
+compile_args = [] if sys.platform == "win32" else ["-O3", "-march=native"]
+
+setup(
+    name="ai-nqueens-solver",
+    ext_modules=cythonize([Extension("_solver", ["_solver.pyx"], extra_compile_args=compile_args)]),
+)
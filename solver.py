@@ -1,9 +1,221 @@
-from collections import deque
+from functools import partial
+from multiprocessing import Pool
+import heapq
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 import random
 import time  
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Without numba the decorated functions simply stay plain Python
+    NUMBA_AVAILABLE = False
+    def njit(*args, **kwargs):
+        return lambda function: function
+
+try:
+    from _solver import MAX_N as CYTHON_MAX_N, solve_nqueens as _solve_c
+    CYTHON_AVAILABLE = True
+except ImportError:
+    # The ahead-of-time compiled solver is optional, build it with: python setup.py build_ext --inplace
+    CYTHON_AVAILABLE = False
+    CYTHON_MAX_N = 0
+
+# Largest board the compiled solver supports, bitmasks are held in signed 64-bit integers
+NUMBA_MAX_N = 62
+# Number of values the LCV ordering ranks before the search starts trying them
+LCV_TOP_K = 4
+# Largest board with a generated solver, CPython allows at most 20 statically nested loops
+SPECIALIZED_MAX_N = 21
+
+
+def _iter_bits(mask):
+    """
+    Generator over the indexes of the set bits of mask, in increasing order.
+    """
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        yield bit.bit_length() - 1
+
+
+def _solve(row, cols, d1, d2, out):
+    """
+    Bitmask backtracking over rows (columns of the board in this solver's terms), starting from the given row.
+    cols, d1 and d2 hold the attacked rows, the attacked "row+col" diagonals shifted into
+    the current column and the attacked "row-col" diagonals shifted into the current column.
+    The search runs on explicit per-row stacks instead of recursion, so it is not bound by the recursion limit.
+    The placed queens are written to out, True is returned when a full placement exists.
+    """
+    n = len(out)
+    full = (1 << n) - 1
+    first_row = row
+    stack_cols = [0] * (n + 1)
+    stack_d1 = [0] * (n + 1)
+    stack_d2 = [0] * (n + 1)
+    # Every set bit of stack_free[row] is a row that is not attacked and not tried yet
+    stack_free = [0] * (n + 1)
+    stack_cols[row], stack_d1[row], stack_d2[row] = cols, d1, d2
+    stack_free[row] = ~(cols | d1 | d2) & full
+    while row >= first_row:
+        if row == n:
+            return True
+        free = stack_free[row]
+        if not free:
+            # No legal rows left, backtracking to the previous column
+            row -= 1
+            continue
+        # Taking the lowest legal row and removing it from the mask
+        bit = free & -free
+        stack_free[row] = free ^ bit
+        out[row] = bit.bit_length() - 1
+        cols = stack_cols[row] | bit
+        d1 = (stack_d1[row] | bit) << 1
+        d2 = (stack_d2[row] | bit) >> 1
+        row += 1
+        stack_cols[row], stack_d1[row], stack_d2[row] = cols, d1, d2
+        stack_free[row] = ~(cols | d1 | d2) & full
+    return False
+
+
+@njit(cache=True, boundscheck=False)
+def _solve_nb(n, result, start=0):
+    """
+    Loop based version of _solve for numba, the recursion is replaced with explicit per-row stacks.
+    The first start entries of result are taken as already placed queens and are kept fixed.
+    The row of the queen in every column is written to result, True is returned when a solution exists.
+    """
+    full = (1 << n) - 1
+    cols = np.zeros(n + 1, dtype=np.int64)
+    d1 = np.zeros(n + 1, dtype=np.int64)
+    d2 = np.zeros(n + 1, dtype=np.int64)
+    mask = np.zeros(n + 1, dtype=np.int64)
+    placed = np.zeros(n, dtype=np.int64)
+    # Replaying the fixed queens into the masks
+    for row in range(start):
+        bit = np.int64(1) << result[row]
+        placed[row] = bit
+        cols[row + 1] = cols[row] | bit
+        d1[row + 1] = (d1[row] | bit) << 1
+        d2[row + 1] = (d2[row] | bit) >> 1
+    mask[start] = ~(cols[start] | d1[start] | d2[start]) & full
+    row = start
+    while row >= start:
+        if row == n:
+            # Translating the placed bits into row indexes
+            for column in range(n):
+                bit = placed[column]
+                index = 0
+                while bit > 1:
+                    bit >>= 1
+                    index += 1
+                result[column] = index
+            return True
+        free = mask[row]
+        if free == 0:
+            # No legal rows left, backtracking to the previous column
+            row -= 1
+            continue
+        bit = free & -free
+        mask[row] = free ^ bit
+        placed[row] = bit
+        cols[row + 1] = cols[row] | bit
+        d1[row + 1] = (d1[row] | bit) << 1
+        d2[row + 1] = (d2[row] | bit) >> 1
+        row += 1
+        mask[row] = ~(cols[row] | d1[row] | d2[row]) & full
+    return False
+
+
+_specialized_solvers = {}
+
+
+def _specialized_source(n):
+    """
+    Generates the source of a bitmask solver for a fixed n, with one nested loop per column.
+    The board width is folded into literal masks and the per-row state lives in local variables.
+    The generated solve(out) writes the bit of the queen in every column to out and returns True on success.
+    """
+    full = (1 << n) - 1
+    lines = ["def solve(out):", "    cols0 = d1_0 = d2_0 = 0", f"    free0 = {full}"]
+    indent = "    "
+    for column in range(n - 1):
+        nxt = column + 1
+        lines += [f"{indent}while free{column}:",
+                  f"{indent}    bit{column} = free{column} & -free{column}",
+                  f"{indent}    free{column} ^= bit{column}",
+                  f"{indent}    cols{nxt} = cols{column} | bit{column}",
+                  f"{indent}    d1_{nxt} = (d1_{column} | bit{column}) << 1",
+                  f"{indent}    d2_{nxt} = (d2_{column} | bit{column}) >> 1",
+                  f"{indent}    free{nxt} = ~(cols{nxt} | d1_{nxt} | d2_{nxt}) & {full}"]
+        indent += "    "
+    # The last column needs no loop, any legal row completes the board
+    lines += [f"{indent}if free{n - 1}:",
+              f"{indent}    bit{n - 1} = free{n - 1} & -free{n - 1}"]
+    lines += [f"{indent}    out[{column}] = bit{column}" for column in range(n)]
+    lines += [f"{indent}    return True", "    return False"]
+    return "\n".join(lines)
+
+
+def _specialized_solver(n):
+    """
+    Returns the solver generated for board size n, compiling it with numba when available.
+    Solvers are cached by n, so repeated solves of the same board size pay the generation cost once.
+    The numba compilation cannot be cached on disk, so only repeated solves prefer it over _solve_nb.
+    """
+    if n not in _specialized_solvers:
+        namespace = {}
+        exec(compile(_specialized_source(n), f"<nqueens_{n}>", "exec"), namespace)
+        _specialized_solvers[n] = njit(namespace["solve"]) if NUMBA_AVAILABLE else namespace["solve"]
+    return _specialized_solvers[n]
+
+
+def _bitmask_solution(n, repeated=False):
+    """
+    Runs the fastest available bitmask solver for an n column board.
+    With repeated set, boards up to SPECIALIZED_MAX_N use the generated kernel for n, which is compiled
+    once per process and then kept warm for the following solves of the same size.
+    Returns the row of the queen in every column, or None if the board has no solution.
+    """
+    queen_rows = np.zeros(n, dtype=np.int64)
+    if 0 < n <= SPECIALIZED_MAX_N and repeated:
+        if not _specialized_solver(n)(queen_rows):
+            return None
+        return [bit.bit_length() - 1 for bit in queen_rows.tolist()]
+    if CYTHON_AVAILABLE and n <= CYTHON_MAX_N:
+        return queen_rows.tolist() if _solve_c(n, queen_rows) else None
+    if 0 < n <= SPECIALIZED_MAX_N and not NUMBA_AVAILABLE:
+        # Without numba the generated solver runs as plain Python, so it costs no compilation
+        if not _specialized_solver(n)(queen_rows):
+            return None
+        return [bit.bit_length() - 1 for bit in queen_rows.tolist()]
+    if NUMBA_AVAILABLE and n <= NUMBA_MAX_N:
+        return queen_rows.tolist() if _solve_nb(n, queen_rows) else None
+    queen_rows = [0] * n
+    return queen_rows if _solve(0, 0, 0, 0, queen_rows) else None
+
+
+def _solve_with_col0(n, first_row):
+    """
+    Solves the board with the queen of the first column fixed to first_row.
+    Returns the row of the queen in every column, or None if this placement cannot be completed.
+    """
+    if CYTHON_AVAILABLE and n <= CYTHON_MAX_N:
+        queen_rows = np.zeros(n, dtype=np.int64)
+        queen_rows[0] = first_row
+        return queen_rows.tolist() if _solve_c(n, queen_rows, 1) else None
+    if NUMBA_AVAILABLE and n <= NUMBA_MAX_N:
+        queen_rows = np.zeros(n, dtype=np.int64)
+        queen_rows[0] = first_row
+        return queen_rows.tolist() if _solve_nb(n, queen_rows, 1) else None
+    queen_rows = [0] * n
+    queen_rows[0] = first_row
+    bit = 1 << first_row
+    return queen_rows if _solve(1, bit, bit << 1, bit >> 1, queen_rows) else None
+
 
 class NQueensCSP:
     """
@@ -12,10 +224,29 @@ class NQueensCSP:
     Otherwise, the random NxN board is initialized and solved. The output of program is 1 based indexes of queens, 
     time statistics and visualization showing final placement of queens.
     """
-    def __init__(self):
+    def __init__(self, bitmask_search=True, use_lcv=False):
 
-        self.domains = {}
-        self.constraints = []
+        # Bitmask backtracking is used by default, the MRV search is kept for generic CSP use
+        self.bitmask_search = bitmask_search
+        # LCV ordering barely prunes N-Queens, so the MRV search tries legal rows in natural order unless asked
+        self.use_lcv = use_lcv
+        self.n = 0
+        self._all_vars = ()
+        # domains[variable] is a bitset of the rows the search may still use for the variable
+        self.domains = []
+        # dom[variable, row] is True while the row is still in the domain of the variable
+        self.dom = np.ones((0, 0), dtype=bool)
+        self._conflict = []
+        # MRV queue of (domain size, -variable, variable) entries for the unassigned variables
+        self._heap = []
+        # Rows, "row+col" diagonals and "row-col+n-1" diagonals taken by the MRV search's queens
+        self._used_rows = 0
+        self._used_diag1 = 0
+        self._used_diag2 = 0
+        # Figure, board size and queen markers of the last visualization, reused while the window stays open
+        self._fig = None
+        self._fig_n = 0
+        self._queen_markers = ()
             
     def input_reader(self, file_path):
         """
@@ -26,7 +257,7 @@ class NQueensCSP:
         if file_path=="pass":
             #Generation of random board
             n = int(input("Please enter the size of NxN board: "))
-            qcolumns = [random.randint(0, n - 1) for _ in range(n)]
+            qcolumns = [random.randint(1, n) for _ in range(n)]
             
         else:
             #reading queen columns from the file
@@ -36,9 +267,22 @@ class NQueensCSP:
         
 
         #initializing domains with all possible row values for each column
-        self.domains = {i: list(range(n)) for i in range(n)}
-        #generating all possible constraints between pairs of variables
-        self.constraints = [(i, j) for i in range(n) for j in range(n) if i != j]
+        self.n = n
+        self._all_vars = tuple(range(n))
+        self.domains = [(1 << n) - 1] * n
+        self.dom = np.ones((n, n), dtype=bool)
+        #compatibility[d * n + row_x, row_y] is 1 if two queens d columns apart can stay in row_x and row_y,
+        #kept flat in float32 so AC3 can count supports of all arcs with a single matrix product
+        rows = np.arange(n)
+        row_distance = np.abs(rows[:, None] - rows[None, :])
+        self._compatibility_flat = ((row_distance[None, :, :] != 0) & (row_distance[None, :, :] != rows[:, None, None])
+                                    ).reshape(n * n, n).astype(np.float32)
+        self._columns = rows
+        self._column_distance = row_distance
+        #conflict[d][row] is the bitmask of rows attacked by a queen in row from d columns away
+        self._conflict = [[(1 << (row - d) if row >= d else 0) | (1 << row) | (1 << (row + d) if row + d < n else 0)
+                           for row in range(n)] for d in range(n)]
+        self._used_rows = self._used_diag1 = self._used_diag2 = 0
         
         
         return qcolumns
@@ -46,10 +290,12 @@ class NQueensCSP:
     def check_consistency(self, current_var, current_val, assignment):
         """
         Function to check if assigning a value to a variable maintains consistency with the current assignment.
+        The assignment holds the row of every column, -1 marks unassigned columns.
         """
         # Checking if the value conflicts with any existing assignments
-        for assigned_var, assigned_val in assignment.items():
-            if assigned_val == current_val or abs(assigned_val - current_val) == abs(assigned_var - current_var):
+        current_bit = 1 << current_val
+        for assigned_var, assigned_val in enumerate(assignment.tolist()):
+            if assigned_val != -1 and self._conflict[abs(current_var - assigned_var)][assigned_val] & current_bit:
                 return False
         
         return True
@@ -60,110 +306,168 @@ class NQueensCSP:
         Function to select an unassigned variable
         """
         # Selecting the variable with the fewest remaining values in its domain
-        unassigned_variables = [variable for variable in range(len(self.domains)) if variable not in assignment]
-        result =  min(unassigned_variables, key=lambda variable: (len(self.domains[variable]), -variable))
-        return result
+        # Assigned variables are popped from the queue, so its top is always unassigned
+        if not self._heap:
+            return None
+        return heapq.heappop(self._heap)[2]
+
+    def push_unassigned(self, variable):
+        """
+        Function which reinserts a variable into the MRV queue when the search unassigns it.
+        The queue orders by the domain sizes left by AC3, which do not change during the search.
+        """
+        heapq.heappush(self._heap, (self.domains[variable].bit_count(), -variable, variable))
 
     def prioritize_domain_values(self, selected_variable, current_assignment):
         """
         Orders the possible values for a given variable using the Least Constraining Value (LCV) heuristic.
         This method prioritizes values that impose the fewest constraints on neighboring variables.
+        Values are yielded lazily: only the best LCV_TOP_K values are ordered up front and the rest
+        are sorted only if the search backtracks past all of them.
         """
-        def calculate_lcv(value):
-            """
-            Computes the LCV for a specific value by counting how many options it leaves open for other variables.
-            """
-            compatibility_count = 0
-            for adjacent_variable in range(len(self.domains)):
-                # Exclude the current variable and those already assigned
-                if adjacent_variable != selected_variable and adjacent_variable not in current_assignment:
-                    for possible_value in self.domains[adjacent_variable]:
-                        # Check if the value is compatible with the current partial solution
-                        if self.check_consistency(adjacent_variable, possible_value, {**current_assignment, selected_variable: value}):
-                            compatibility_count += 1
-            return compatibility_count
+        # Only the current variable's unassigned neighbors are counted
+        open_variables = [variable for variable in np.flatnonzero(current_assignment == -1).tolist()
+                          if variable != selected_variable]
+
+        # Bitset of the rows each open neighbor can still take, paired with its column distance
+        open_values = [(self._conflict[abs(variable - selected_variable)],
+                        self.domains[variable] & ~self.attacked_rows(variable))
+                       for variable in open_variables]
+
+        # The LCV of each candidate is the number of options it leaves open for other variables,
+        # a popcount of the neighbor's open rows minus the rows the candidate attacks
+        candidate_values = np.fromiter(_iter_bits(self.domains[selected_variable]), dtype=np.int64)
+        lcv = np.array([sum((rows & ~conflict[value]).bit_count() for conflict, rows in open_values)
+                        for value in candidate_values.tolist()], dtype=np.int64)
 
         # Order the values for the selected_variable by their LCV, preferring those with higher counts
-        return sorted(self.domains[selected_variable], key=calculate_lcv, reverse=True)
+        # Ties keep the domain order, the position is folded into the key to make every key unique
+        keys = -lcv * len(candidate_values) + np.arange(len(candidate_values))
+        top_k = min(LCV_TOP_K, len(candidate_values))
+        if top_k == 0:
+            return
+        partition = np.argpartition(keys, top_k - 1)
+        best, rest = partition[:top_k], partition[top_k:]
+        yield from candidate_values[best[np.argsort(keys[best])]].tolist()
+        yield from candidate_values[rest[np.argsort(keys[rest])]].tolist()
 
-    def revise_domains(self, variable_x, variable_y):
+    def revise_domains(self):
         """
-        Updates the domains of two variables to ensure arc consistency is maintained.
-        This function iteratively checks and removes values from the domain of variable_x
-        that are inconsistent with the domain of variable_y, based on the constraints between them.
+        Updates the domains of all variables to ensure arc consistency is maintained.
+        Every arc is revised in the same sweep: a value of variable_x is kept only if each
+        other variable_y still has a value in its domain compatible with it.
         """
-        domain_updated = False
-        for value_x in self.domains[variable_x][:]:  # Copy of the domain to iterate over
-            # Check if there's no value in variable_y's domain compatible with value_x
-            if all(not any(value_x == value_y for value_y in self.domains[variable_y]) for value_y in self.domains[variable_y]):
-                # If no compatible value found, remove value_x from variable_x's domain
-                self.domains[variable_x].remove(value_x)
-                domain_updated = True
+        n = self.n
+        # supported[d, row_x, variable_y] tells if variable_y has a value compatible with row_x from d columns away
+        supported = (self._compatibility_flat @ self.dom.T.astype(np.float32)).reshape(n, n, n) > 0
+        # support[variable_x, variable_y, row_x] gathers the arcs by the column distance of each pair
+        support = supported[self._column_distance, :, self._columns[None, :]]
+        # A variable does not constrain itself
+        support[self._columns, self._columns] = True
+        revised = self.dom & support.all(axis=1)
+        domain_updated = not np.array_equal(revised, self.dom)
+        self.dom = revised
         return domain_updated
 
     def apply_arcconsistency_algorithm(self):
         """
         Implements the AC3 algorithm to achieve arc consistency across all variables.
+        Instead of a queue of arcs, all arcs are revised together until no domain changes.
         """
-        # Create a queue to hold all the constraints for processing
-        constraints_queue = deque(self.constraints)
-        while constraints_queue:
-            # Remove and process the first constraint from the queue
-            current_var, next_var = constraints_queue.popleft()
-            # Attempt to enforce arc consistency between current_var and next_var
-            if self.revise_domains(current_var, next_var):
-                # If the domain of current_var is empty, a solution is not possible
-                if not self.domains[current_var]:
-                    return False
-                # Re-enqueue constraints involving current_var for re-evaluation
-                for adjacent_var, _ in self.constraints:
-                    if adjacent_var != next_var:
-                        constraints_queue.append((adjacent_var, current_var))
+        while self.revise_domains():
+            # If the domain of any variable is empty, a solution is not possible
+            if not self.dom.any(axis=1).all():
+                return False
+        # Packing the revised boolean domains into bitsets for the search
+        self.domains = [int.from_bytes(np.packbits(self.dom[variable], bitorder='little').tobytes(), 'little')
+                        for variable in self._all_vars]
+        # Filling the MRV queue with the revised domain sizes
+        self._heap = [(self.domains[variable].bit_count(), -variable, variable) for variable in self._all_vars]
+        heapq.heapify(self._heap)
         return True
 
 
-    def attempt_solution(self, current_assignment):
+    def toggle_queen(self, variable, value):
+        """
+        Function which places (or removes, when it is already placed) a queen in the occupancy bitmasks.
+        """
+        self._used_rows ^= 1 << value
+        self._used_diag1 ^= 1 << (value + variable)
+        self._used_diag2 ^= 1 << (value - variable + self.n - 1)
+
+    def attacked_rows(self, variable):
+        """
+        Returns the bitset of the rows of a variable that the placed queens attack.
+        """
+        # Shifting both diagonal masks so that bit r stands for row r of this variable
+        return self._used_rows | (self._used_diag1 >> variable) | (self._used_diag2 >> (self.n - 1 - variable))
+
+    def legal_values(self, variable):
+        """
+        Generator over the domain values of a variable that no placed queen attacks, in increasing order.
+        """
+        return _iter_bits(self.domains[variable] & ~self.attacked_rows(variable))
+
+    def attempt_solution(self, current_assignment, assigned_count=0):
         """
         A recursive utility function to facilitate the backtracking search process.
+        The assignment array is shared by every level of the search, -1 marks unassigned columns.
         """
         # Check if a complete assignment is achieved
-        if len(current_assignment) == len(self.domains):
+        if assigned_count == self.n:
             return current_assignment
         # Identify an unassigned variable for potential assignment
         next_variable = self.select_unassigned(current_assignment)
-        # Retrieve a list of viable values for the next_variable based on the LCV heuristic
-        viable_values = self.prioritize_domain_values(next_variable, current_assignment)
+        if self.use_lcv:
+            # Retrieve the viable values for the next_variable based on the LCV heuristic
+            viable_values = self.prioritize_domain_values(next_variable, current_assignment)
+            # The placed queens stay the same for every value tried at this level
+            placed_queens = [(column, row) for column, row in enumerate(current_assignment.tolist()) if row != -1]
+        else:
+            # Every value left in the legal mask is already consistent with the current assignment
+            viable_values = self.legal_values(next_variable)
 
         for possible_value in viable_values:
-            # Ensure the selected value maintains consistency across the board
-            if self.check_consistency(next_variable, possible_value, current_assignment):
-                # Temporarily assign the selected value to the variable
-                current_assignment[next_variable] = possible_value
-                # Recursively attempt to build upon the current partial solution
-                potential_solution = self.attempt_solution(current_assignment)
-                # If a valid solution is formed, return it
-                if potential_solution is not None:
-                    return potential_solution
-                # If the attempt fails, retract the assignment and try the next possibility
-                del current_assignment[next_variable]
+            if self.use_lcv:
+                # Ensure the selected value maintains consistency across the board (check_consistency inlined)
+                consistent = True
+                for assigned_var, assigned_val in placed_queens:
+                    value_gap = possible_value - assigned_val
+                    if value_gap == 0 or value_gap == next_variable - assigned_var or value_gap == assigned_var - next_variable:
+                        consistent = False
+                        break
+                if not consistent:
+                    continue
+            # Temporarily assign the selected value to the variable
+            current_assignment[next_variable] = possible_value
+            self.toggle_queen(next_variable, possible_value)
+            # Recursively attempt to build upon the current partial solution
+            potential_solution = self.attempt_solution(current_assignment, assigned_count + 1)
+            # If a valid solution is formed, return it
+            if potential_solution is not None:
+                return potential_solution
+            # If the attempt fails, retract the assignment and try the next possibility
+            current_assignment[next_variable] = -1
+            self.toggle_queen(next_variable, possible_value)
 
+        # Putting the variable back into the MRV queue before backtracking
+        self.push_unassigned(next_variable)
         # Return None if no valid solution can be constructed
         return None
 
     
-    def visualize_board(self, initial_positions, final_positions):
-        # Determine the board size from the domains, assuming a square board
-        n = len(self.domains)
-
+    def _create_board_figure(self, n):
+        """
+        Creates the two board figure with empty queen markers and caches it for later visualizations.
+        """
         # Create figure with two subplots
-        fig, ax = plt.subplots(1, 2, figsize=(20, 10))  
+        fig, ax = plt.subplots(1, 2, figsize=(20, 10))
 
-        # Prepare the checkerboard pattern and settings for both plots
+        # Prepare the checkerboard as a ready RGBA image once and share it between both plots
+        chessboard = ((np.arange(n)[:, None] + np.arange(n)) & 1).astype(np.uint8)
+        board_rgba = plt.get_cmap('gray')(chessboard * 255)
         for subplot in ax:
-            chessboard = np.zeros((n, n))
-            chessboard[1::2, 0::2] = 1
-            chessboard[0::2, 1::2] = 1
-            subplot.imshow(chessboard, cmap='gray')
+            subplot.imshow(board_rgba)
             subplot.set_xticks(np.arange(-.5, n, 1), minor=True)
             subplot.set_yticks(np.arange(-.5, n, 1), minor=True)
             subplot.grid(which="minor", color="black", linestyle='-', linewidth=2)
@@ -171,37 +475,80 @@ class NQueensCSP:
             subplot.set_xticks([])
             subplot.set_yticks([])
 
+        # Initial positions go on the left board, final positions on the right board
+        initial_markers = ax[0].scatter([], [], marker='x', color='red', s=100)
+        ax[0].set_title('Initial Positions')
+        final_markers = ax[1].scatter([], [], marker='o', color='gold', s=100)
+        ax[1].set_title('Final Positions')
+
+        self._fig, self._fig_n, self._queen_markers = fig, n, (initial_markers, final_markers)
+
+    def visualize_board(self, initial_positions, final_positions):
+        # Board size as read by input_reader, assuming a square board
+        n = self.n
+
+        # Build the figure only for a new board size or when the previous window was closed
+        if self._fig is None or self._fig_n != n or not plt.fignum_exists(self._fig.number):
+            if self._fig is not None:
+                plt.close(self._fig)
+            self._create_board_figure(n)
+
         # Adjust initial and final positions for 0-based indexing and matplotlib's coordinate system
         # Note: Subtracting 1 from both x and y to align with 0-based indexing
-        initial_positions_adj = [(x - 1, y - 1) for x, y in initial_positions]
-        final_positions_adj = [(x - 1, y - 1) for x, y in final_positions]
+        initial_xs, initial_ys = np.array(initial_positions).reshape(-1, 2).T - 1
+        final_xs, final_ys = np.array(final_positions).reshape(-1, 2).T - 1
 
-        # Plot initial positions on the left board
-        for x, y in initial_positions_adj:
-            ax[0].plot(y, x, 'x', color='red', markersize=10)
-        ax[0].set_title('Initial Positions')
-
-        # Plot final positions on the right board
-        for x, y in final_positions_adj:
-            ax[1].plot(y, x, 'o', color='gold', markersize=10)
-        ax[1].set_title('Final Positions')
+        # Only the queen markers are updated, the boards themselves are left untouched
+        initial_markers, final_markers = self._queen_markers
+        initial_markers.set_offsets(np.column_stack((initial_ys, initial_xs)))
+        final_markers.set_offsets(np.column_stack((final_ys, final_xs)))
+        self._fig.canvas.draw_idle()
 
         plt.show()
 
 
-    def resolve_nqueens(self, input_path):
+    def parallel_bitmask_search(self):
+        """
+        Splits the bitmask search by the row of the first column's queen and solves the parts in separate processes.
+        The first part which completes with a solution wins, the workers still searching the other parts are terminated.
+        """
+        first_rows = list(_iter_bits(self.domains[0]))
+        pool = Pool(processes=os.cpu_count())
+        try:
+            for queen_rows in pool.imap_unordered(partial(_solve_with_col0, self.n), first_rows):
+                if queen_rows is not None:
+                    return queen_rows
+            return None
+        finally:
+            # Stopping the losing searches instead of waiting for them, their results are no longer needed
+            pool.terminate()
+            pool.join()
+
+    def resolve_nqueens(self, input_path, parallel=False):
         """
         Main function which tackles the N-Queens challenge employing Constraint Satisfaction Problem (CSP) strategies.
+        With parallel set, the bitmask search is spread over all CPU cores.
         """
         start_time = time.time()  # Record the start time
 
         # Acquire board setup from the provided file path, initializing domains and constraints accordingly
         initial_queen_positions = self.input_reader(input_path)
         initial_queen_positions_forvisual = [(index + 1, number) for index, number in enumerate(initial_queen_positions)]
+        solution_assignment = None
         # Attempt to ensure arc consistency across all variables
         if self.apply_arcconsistency_algorithm():  # Replaces search_for_solution call with direct AC3 application
             # Initiate a backtracking search to discover a viable solution
-            solution_assignment = self.attempt_solution({})
+            if self.bitmask_search and parallel:
+                queen_rows = self.parallel_bitmask_search()
+                solution_assignment = dict(enumerate(queen_rows)) if queen_rows is not None else None
+            elif self.bitmask_search:
+                queen_rows = _bitmask_solution(self.n)
+                solution_assignment = dict(enumerate(queen_rows)) if queen_rows is not None else None
+            else:
+                empty_assignment = np.full(self.n, -1, dtype=np.int8 if self.n <= 128 else np.int32)
+                solution_assignment = self.attempt_solution(empty_assignment)
+                if solution_assignment is not None:
+                    solution_assignment = dict(enumerate(solution_assignment.tolist()))
             # Verify and display the outcome
             if solution_assignment is None:
                 print("No solution found")
@@ -226,8 +573,26 @@ class NQueensCSP:
         else:
             print("No solution found.")
 
+    def solve_board_sizes(self, board_sizes):
+        """
+        Solves an empty board for every size in board_sizes with the bitmask search, for batch studies.
+        The generated kernel of each size stays compiled between solves, so repeated sizes skip the compilation.
+        Returns the rows of the queens for every board, None for boards without a solution.
+        """
+        return [_bitmask_solution(n, repeated=True) for n in board_sizes]
+
+    def resolve_nqueens_parallel(self, input_path):
+        """
+        Same as resolve_nqueens, but the search is run on all CPU cores.
+        """
+        self.resolve_nqueens(input_path, parallel=True)
+
 
 # Instantiate the NQueensCSP class and invoke the solution method
-csp_solver_instance = NQueensCSP()
-csp_solver_instance.resolve_nqueens("pass")
-#csp_solver_instance.resolve_nqueens(r"path_to_file")
+# The guard keeps worker processes of the parallel search from running it again on import
+if __name__ == "__main__":
+    csp_solver_instance = NQueensCSP()
+    csp_solver_instance.resolve_nqueens("pass")
+    #csp_solver_instance.resolve_nqueens(r"path_to_file")
+    #csp_solver_instance.resolve_nqueens_parallel("pass")
+    #print(csp_solver_instance.solve_board_sizes([8] * 100))